@@ -14,7 +14,7 @@ from math import sqrt
 import heapq
 from typing import NamedTuple, Tuple, Sequence, List
 
-from .numbertheory import mod_inv, mod_sqrt, legendre_symbol
+from .numbertheory import mod_inv, mod_sqrt
 
 class Point(NamedTuple):
     """Elliptic curve point.
@@ -90,6 +90,8 @@ class Curve:
             raise ValueError("Generator is not on the 'x^3 + a*x + b' curve")
         self.G = Point(int(G[0]), int(G[1]))
         self.GJ = self.G[0], self.G[1], 1  # Jacobian coordinates
+        # fixed-base table of G multiples, lazily built by _mult_jac_G
+        self._GJ_table: List[List[_JacPoint]] = list()
 
         # 5. Check that n is prime.
         if n < 2 or (n > 2 and not pow(2, n-1, n) == 1):
@@ -168,11 +170,45 @@ class Curve:
         if Q[2] == 0:  # Infinity point in Jacobian coordinates
             return Point()
         else:
-            Z2 = Q[2]*Q[2]
-            x = (Q[0]*mod_inv(Z2, self._p)) % self._p
-            y = (Q[1]*mod_inv(Z2*Q[2], self._p)) % self._p
+            # a single mod_inv: Z^-2 and Z^-3 are both derived from Z^-1
+            Z1 = mod_inv(Q[2], self._p)
+            Z2 = Z1*Z1
+            x = (Q[0]*Z2) % self._p
+            y = (Q[1]*Z2*Z1) % self._p
             return Point(x, y)
 
+    def _aff_from_jac_batch(self, Qs: Sequence[_JacPoint]) -> List[Point]:
+        # points are assumed to be on curve
+        # Montgomery's trick: a single mod_inv for all the points
+        prods: List[int] = list()
+        acc = 1
+        for Q in Qs:
+            prods.append(acc)
+            if Q[2] != 0:  # skip Infinity point in Jacobian coordinates
+                acc = (acc * Q[2]) % self._p
+        acc = mod_inv(acc, self._p)
+        result: List[Point] = [Point()] * len(Qs)
+        for i in range(len(Qs) - 1, -1, -1):
+            Q = Qs[i]
+            if Q[2] != 0:
+                Z1 = (acc * prods[i]) % self._p  # Z^-1
+                acc = (acc * Q[2]) % self._p
+                Z2 = Z1*Z1
+                result[i] = Point((Q[0]*Z2) % self._p, (Q[1]*Z2*Z1) % self._p)
+        return result
+
+    def _jac_equality(self, Q: _JacPoint, R: _JacPoint) -> bool:
+        # points are assumed to be on curve
+        # compare without mod_inv: X1*Z2^2 == X2*Z1^2, Y1*Z2^3 == Y2*Z1^3
+        if Q[2] == 0 or R[2] == 0:  # Infinity point in Jacobian coordinates
+            return Q[2] == R[2] == 0
+
+        RZ2 = R[2] * R[2]
+        QZ2 = Q[2] * Q[2]
+        if Q[0]*RZ2 % self._p != R[0]*QZ2 % self._p:
+            return False
+        return Q[1]*RZ2*R[2] % self._p == R[1]*QZ2*Q[2] % self._p
+
     # methods using _a, _b, _p
 
     def add(self, Q1: Point, Q2: Point) -> Point:
@@ -183,8 +219,9 @@ class Curve:
 
         self.require_on_curve(Q1)
         self.require_on_curve(Q2)
-        # no Jacobian coordinates here as _aff_from_jac would cost 2 mod_inv
-        # while _add_aff costs only one mod_inv
+        # no Jacobian coordinates here as _aff_from_jac would cost one
+        # mod_inv on top of the Jacobian addition, while _add_aff costs
+        # only one mod_inv
         return self._add_aff(Q1, Q2)
 
     def _add_jac(self, Q: _JacPoint, R: _JacPoint) -> _JacPoint:
@@ -300,20 +337,21 @@ class Curve:
         if not self.pIsThreeModFour:
             raise ValueError("this method works only when p = 3 (mod 4)")
         root = self.y(x)
-        # switch to quadratic residue root as needed
-        legendre = legendre_symbol(root, self._p)
-        return root if legendre == quad_res else self._p - root
+        # as p = 3 (mod 4), mod_sqrt returns root = y2^((p+1)/4), which is
+        # a quadratic residue: root^((p-1)/2) = (y2^((p-1)/2))^((p+1)/4) = 1
+        # hence no Legendre symbol is needed
+        return root if quad_res else (self._p - root) % self._p
 
 
 def mult(ec: Curve, n: int, Q: Point = None) -> Point:
     # this function is used by the Curve class; it might be a method...
     # but it does not need to
     if Q is None:
-        QJ = ec.GJ
+        R = _mult_jac_G(ec, n)
     else:
         ec.require_on_curve(Q)
         QJ = _jac_from_aff(Q)
-    R = _mult_jac(ec, n, QJ)
+        R = _mult_jac(ec, n, QJ)
     return ec._aff_from_jac(R)
 
 
@@ -349,6 +387,49 @@ def _mult_jac(ec: Curve, m: int, Q: _JacPoint) -> _JacPoint:
     return R
 
 
+# window width (bits) of the fixed-base table used by _mult_jac_G
+_G_WINDOW = 4
+
+
+def _build_GJ_table(ec: Curve) -> List[List[_JacPoint]]:
+    # table[i][j] = j * 2^(_G_WINDOW*i) * G in Jacobian coordinates,
+    # stored in ec._GJ_table by _mult_jac_G on first use
+
+    size = 1 << _G_WINDOW
+    table: List[List[_JacPoint]] = list()
+    Q = ec.GJ
+    for _ in range((ec.nlen + _G_WINDOW - 1) // _G_WINDOW):
+        row = [(1, 1, 0), Q]
+        for _ in range(2, size):
+            row.append(ec._add_jac(row[-1], Q))
+        table.append(row)
+        Q = ec._add_jac(row[-1], Q)
+    # normalize to Z=1: _add_jac has no mixed addition formulas, but
+    # its products by Z, Z^2 and Z^3 become cheap big int products by 1
+    points = ec._aff_from_jac_batch([Q for row in table for Q in row])
+    for i, row in enumerate(table):
+        for j in range(size):
+            row[j] = _jac_from_aff(points[i*size + j])
+    return table
+
+
+def _mult_jac_G(ec: Curve, m: int) -> _JacPoint:
+    # fixed-base multiplication m*G in Jacobian coordinates:
+    # one table lookup and addition per _G_WINDOW bits of m, no doubling
+
+    m %= ec.n
+    mask = (1 << _G_WINDOW) - 1
+    if not ec._GJ_table:
+        ec._GJ_table = _build_GJ_table(ec)
+    R = 1, 1, 0                    # initialize as infinity point
+    for row in ec._GJ_table:
+        if m == 0:
+            break
+        R = ec._add_jac(R, row[m & mask])
+        m >>= _G_WINDOW
+    return R
+
+
 def double_mult(ec: Curve, u: int, H: Point, v: int, Q: Point = None) -> Point:
     """Shamir trick for efficient computation of u*H + v*Q"""
 
@@ -377,18 +458,15 @@ def _double_mult(ec: Curve, u: int, HJ: _JacPoint,
     if v == 0 or QJ[2] == 0:
         return _mult_jac(ec, u, HJ)
 
+    # one addition per bit pair, using H+Q when both bits are set
+    table = (1, 1, 0), HJ, QJ, ec._add_jac(HJ, QJ)
     R = 1, 1, 0  # initialize as infinity point
     msb = max(u.bit_length(), v.bit_length())
-    while msb > 0:
-        if u >> (msb - 1):  # checking msb
-            R = ec._add_jac(R, HJ)
-            u -= pow(2, u.bit_length() - 1)
-        if v >> (msb - 1):  # checking msb
-            R = ec._add_jac(R, QJ)
-            v -= pow(2, v.bit_length() - 1)
-        if msb > 1:
-            R = ec._add_jac(R, R)
-        msb -= 1
+    for i in range(msb - 1, -1, -1):
+        R = ec._add_jac(R, R)
+        j = ((u >> i) & 1) | (((v >> i) & 1) << 1)
+        if j:
+            R = ec._add_jac(R, table[j])
 
     return R
 
@@ -421,19 +499,30 @@ def _multi_mult(ec: Curve,
                 scalars: Sequence[int],
                 JPoints: Sequence[_JacPoint]) -> _JacPoint:
     # source: https://cr.yp.to/badbatch/boscoster2.py
-
-    x = list(zip([-n for n in scalars], JPoints))
+    # Pippenger's bucket method has better asymptotics, but here
+    # it is not faster than Bos-Coster even for thousands of points:
+    # heap operations are cheap with respect to point additions
+
+    # zero scalars and infinity points are dropped:
+    # they do not contribute and would stall the loop below
+    points: List[_JacPoint] = list()
+    x: List[Tuple[int, int]] = list()  # heap of (-scalar, index in points)
+    for n, P in zip(scalars, JPoints):
+        n %= ec.n
+        if n != 0 and P[2] != 0:
+            x.append((-n, len(points)))
+            points.append(P)
+    if not x:
+        return 1, 1, 0
     heapq.heapify(x)
     while len(x) > 1:
-        np1 = heapq.heappop(x)
-        np2 = heapq.heappop(x)
-        n1, p1 = -np1[0], np1[1]
-        n2, p2 = -np2[0], np2[1]
-        p2 = ec._add_jac(p1, p2)
+        n1, i1 = heapq.heappop(x)
+        n2, i2 = x[0]
+        # n1*P1 + n2*P2 = (n1-n2)*P1 + n2*(P1+P2):
+        # the top of the heap keeps its scalar, only its point changes
+        points[i2] = ec._add_jac(points[i1], points[i2])
         n1 -= n2
-        if n1 > 0:
-            heapq.heappush(x, (-n1, p1))
-        heapq.heappush(x, (-n2, p2))
-    np1 = heapq.heappop(x)
-    n1, p1 = -np1[0], np1[1]
-    return _mult_jac(ec, n1, p1)
+        if n1 < 0:
+            heapq.heappush(x, (n1, i1))
+    n1, i1 = x[0]
+    return _mult_jac(ec, -n1, points[i1])
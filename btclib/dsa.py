@@ -21,7 +21,7 @@ from typing import Tuple, List, Optional
 
 from .numbertheory import mod_inv
 from .utils import int_from_bits, HashF
-from .curve import Point, Curve, _mult_jac, _double_mult, double_mult
+from .curve import Point, Curve, _mult_jac_G, _double_mult, double_mult
 from .rfc6979 import _rfc6979
 
 ECDS = Tuple[int, int]  # Tuple[scalar, scalar]
@@ -72,7 +72,7 @@ def _sign(ec: Curve, c: int, q: int, k: int) -> ECDS:
 
     # Steps numbering follows SEC 1 v.2 section 4.1.3
 
-    RJ = _mult_jac(ec, k, ec.GJ)                  # 1
+    RJ = _mult_jac_G(ec, k)                       # 1
 
     Rx = (RJ[0]*mod_inv(RJ[2]*RJ[2], ec._p)) % ec._p
     r = Rx % ec.n                                 # 2, 3
@@ -42,11 +42,17 @@ def xgcd(a: int, b: int) -> Tuple[int, int, int]:
 def mod_inv(a: int, m: int) -> int:
     """Return the inverse of a (mod m). m does not have to be a prime.
 
-    Based on Extended Euclidean Algorithm, see:
+    The C-coded built-in pow(a, -1, m) is used if available
+    (python 3.8+), else the Extended Euclidean Algorithm, see:
     https://en.wikibooks.org/wiki/Algorithm_Implementation/Mathematics/Extended_Euclidean_algorithm
     """
 
     a %= m
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        # not invertible, or python < 3.8
+        pass
     g, x, _ = xgcd(a, m)
     if g == 1:
         return x % m
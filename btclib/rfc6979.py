@@ -41,6 +41,14 @@ from .utils import Octets, _int_from_bits, int_from_bits, octets_from_int, \
     HashF
 from .curve import Curve
 
+try:
+    # python 3.7+: one-shot HMAC, C-coded for OpenSSL hash functions
+    from hmac import digest as _hmac
+except ImportError:
+    def _hmac(key: bytes, msg: bytes, digest: HashF) -> bytes:
+        return hmac.new(key, msg, digest).digest()
+
+
 def rfc6979(ec: Curve, hf: HashF, mhd: bytes, q: int) -> int:
     """Return a deterministic ephemeral key following RFC 6979."""
 
@@ -72,18 +80,18 @@ def _rfc6979(ec: Curve, hf: HashF, c: int, q: int) -> int:
     V = b'\x01' * hsize                                    # 3.2.b
     K = b'\x00' * hsize                                    # 3.2.c
 
-    K = hmac.new(K, V + b'\x00' + bprvbm, hf).digest()     # 3.2.d
-    V = hmac.new(K, V, hf).digest()                        # 3.2.e
-    K = hmac.new(K, V + b'\x01' + bprvbm, hf).digest()     # 3.2.f
-    V = hmac.new(K, V, hf).digest()                        # 3.2.g
+    K = _hmac(K, V + b'\x00' + bprvbm, hf)                 # 3.2.d
+    V = _hmac(K, V, hf)                                    # 3.2.e
+    K = _hmac(K, V + b'\x01' + bprvbm, hf)                 # 3.2.f
+    V = _hmac(K, V, hf)                                    # 3.2.g
 
     while True:                                            # 3.2.h
         T = b''                                            # 3.2.h.1
         while len(T) < ec.nsize:                           # 3.2.h.2
-            V = hmac.new(K, V, hf).digest()
+            V = _hmac(K, V, hf)
             T += V
         k = _int_from_bits(ec, T)  # candidate             # 3.2.h.3
         if 0 < k < ec.n:           # acceptable values for k
             return k               # successful candidate
-        K = hmac.new(K, V + b'\x00', hf).digest()
-        V = hmac.new(K, V, hf).digest()
+        K = _hmac(K, V + b'\x00', hf)
+        V = _hmac(K, V, hf)
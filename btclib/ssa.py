@@ -17,10 +17,10 @@ https://github.com/sipa/bips/blob/bip-schnorr/bip-schnorr.mediawiki.
 
 import heapq
 import random
-from typing import Tuple, List, Sequence, Optional
+from typing import Tuple, List, Dict, Sequence, Optional
 
 from .numbertheory import mod_inv, legendre_symbol
-from .curve import Point, Curve, mult, _mult_jac, double_mult, _double_mult, \
+from .curve import Point, Curve, mult, _mult_jac_G, _double_mult, \
     _jac_from_aff, _multi_mult
 from .utils import int_from_bits, octets_from_point, octets_from_int, HashF
 from .rfc6979 import rfc6979
@@ -28,10 +28,15 @@ from .rfc6979 import rfc6979
 ECSS = Tuple[int, int]  # Tuple[field element, scalar]
 
 
-def _ensure_msg_size(hf: HashF, msg: bytes) -> None:
-    if len(msg) != hf().digest_size:
+def _ensure_msg_size(hf: HashF, msg: bytes,
+                     hsize: Optional[int] = None) -> None:
+    # hsize, if provided, is the digest size of hf:
+    # it avoids instantiating hf just to read it
+    if hsize is None:
+        hsize = hf().digest_size
+    if len(msg) != hsize:
         errmsg = f'message of wrong size: {len(msg)}'
-        errmsg += f' instead of {hf().digest_size} bytes'
+        errmsg += f' instead of {hsize} bytes'
         raise ValueError(errmsg)
 
 
@@ -82,7 +87,7 @@ def sign(ec: Curve,
         raise ValueError(f"ephemeral key {hex(k)} not in [1, n-1]")
 
     # Let R = k'G.
-    RJ = _mult_jac(ec, k, ec.GJ)
+    RJ = _mult_jac_G(ec, k)
 
     # break the simmetry: any criteria might have been used,
     # jacobi is the proposed bitcoin standard
@@ -121,7 +126,9 @@ def _verify(ec: Curve,
             P: Point,
             sig: ECSS) -> bool:
     # Private function for test/dev purposes
-    # It raises Errors, while verify should always return True or False
+    # It raises Errors for invalid input (curve, signature, message,
+    # or public key), it returns False if the signature does not verify;
+    # verify should always return True or False
 
     # the bitcoin proposed standard is only valid for curves
     # whose prime p = 3 % 4
@@ -129,7 +136,9 @@ def _verify(ec: Curve,
         errmsg = 'curve prime p must be equal to 3 (mod 4)'
         raise ValueError(errmsg)
 
-    # Let r = int(sig[ 0:32]).
+    # cheap checks first, before any scalar multiplication
+
+    # Let r = int(sig[ 0:32]); fail if r is not [0, p-1].
     # Let s = int(sig[32:64]); fail if s is not [0, n-1].
     r, s = _to_sig(ec, sig)
 
@@ -144,20 +153,62 @@ def _verify(ec: Curve,
     # Let e = int(hf(bytes(r) || bytes(P) || mhd)) mod n.
     e = _e(ec, hf, r, P, mhd)
 
-    # Let R = sG - eP.
-    # in Jacobian coordinates
-    R = _double_mult(ec, -e, (P[0], P[1], 1), s, ec.GJ)
+    # Fail if r is not the x-coordinate of a curve point:
+    # no R = sG - eP can have R.x = r
+    try:
+        y = ec.y_quadratic_residue(r, True)
+    except ValueError:
+        return False
 
-    # Fail if infinite(R).
-    if R[2] == 0:
-        raise ValueError("sG - eP is infinite")
+    # with cofactor 1 the check with half-size scalars is exact
+    if ec.h == 1:
+        return _verify_split(ec, r, y, s, e, P)
 
-    # Fail if jacobi(R.y) ≠ 1.
-    if legendre_symbol(R[1]*R[2] % ec._p, ec._p) != 1:
-        raise ValueError("(sG - eP).y is not a quadratic residue")
+    # jacobi(0) = 0: no R with R.x = r has jacobi(R.y) = 1
+    if y == 0:
+        return False
 
-    # Fail if R.x ≠ r.
-    return R[0] == (R[2]*R[2]*r % ec._p)
+    # Let R = sG - eP.
+    # in Jacobian coordinates
+    RJ = _double_mult(ec, -e, (P[0], P[1], 1), s, ec.GJ)
+
+    # Fail if infinite(R), jacobi(R.y) ≠ 1, or R.x ≠ r:
+    # (r, y) is the only point satisfying all of them
+    return ec._jac_equality(RJ, (r, y, 1))
+
+
+def _split_challenge(e: int, n: int) -> Tuple[int, int]:
+    # Return (u, v) with u = e*v (mod n), v != 0, and |u|, |v| < sqrt(n).
+    # Lattice basis reduction in dimension 2, i.e. the extended Euclidean
+    # algorithm on (n, e) stopped halfway: see
+    # Pornin, "Optimized Lattice Basis Reduction In Dimension 2, and Fast
+    # Schnorr and EdDSA Signature Verification", https://eprint.iacr.org/2020/454
+
+    r0, r1 = n, e % n
+    t0, t1 = 0, 1
+    # invariant: r_i = t_i * e (mod n)
+    while r1*r1 >= n:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q*r1
+        t0, t1 = t1, t0 - q*t1
+    return r1, t1
+
+
+def _verify_split(ec: Curve, r: int, y: int,
+                  s: int, e: int, P: Point) -> bool:
+    # Check sG - eP = R, with R = (r, y) and y quadratic residue,
+    # as (v*s)G - vR - uP = Inf, where u = e*v (mod n) and
+    # u, v have half the bit size of e.
+    # As v != 0 (mod n) this is equivalent only if n is the order
+    # of the whole curve group, i.e. cofactor is 1.
+    # P is assumed to be on curve and not infinite.
+
+    u, v = _split_challenge(e, ec.n)
+    # -vR and -uP with positive scalars
+    RJ = (r, y, 1) if v < 0 else (r, ec._p - y, 1)
+    PJ = (P[0], P[1], 1) if u < 0 else (P[0], ec._p - P[1], 1)
+    RJ = _double_mult(ec, abs(v), RJ, abs(u), PJ)
+    return ec._add_jac(_mult_jac_G(ec, v*s), RJ)[2] == 0
 
 
 def _pubkey_recovery(ec: Curve,
@@ -174,9 +225,10 @@ def _pubkey_recovery(ec: Curve,
     if e == 0:
         raise ValueError("invalid (zero) challenge e")
     e1 = mod_inv(e, ec.n)
-    P = double_mult(ec, -e1, K, e1*s)
-    assert P[1] != 0, "how did you do that?!?"
-    return P
+    # P = e1*s*G - e1*K, with -e1 as n - e1 in the joint ladder
+    PJ = _double_mult(ec, ec.n - e1, (K[0], K[1], 1), e1*s, ec.GJ)
+    assert PJ[2] != 0, "how did you do that?!?"
+    return ec._aff_from_jac(PJ)
 
 
 def _to_sig(ec: Curve, sig: ECSS) -> ECSS:
@@ -188,8 +240,10 @@ def _to_sig(ec: Curve, sig: ECSS) -> ECSS:
         mhd = f"invalid length {len(sig)} for ECSSA signature"
         raise TypeError(mhd)
 
-    # Let r = int(sig[ 0:32]).
+    # Let r = int(sig[ 0:32]); fail if r is not [0, p-1].
     r = int(sig[0])
+    if not 0 <= r < ec._p:
+        raise ValueError(f"r ({hex(r)}) not in [0, p-1]")
 
     # Let s = int(sig[32:64]); fail if s is not [0, n-1].
     s = int(sig[1])
@@ -238,37 +292,60 @@ def _batch_verify(ec: Curve,
     if batch_size == 1:
         return _verify(ec, hf, ms[0], P[0], sig[0])
 
+    # loop invariants
+    hsize = hf().digest_size
+    n = ec.n
+    nlen = ec.nlen
+    getrandbits = random.getrandbits
+
     t = 0
-    scalars: List(int) = list()
+    scalars: List[int] = list()
     points: List[Point] = list()
+    # index in points of each (already validated) public key:
+    # the scalars of a repeated public key are summed together,
+    # reducing the size of the multi scalar multiplication
+    pubkeys: Dict[Tuple[int, int], int] = dict()
+    # (e, y(r)) for each (r, pubkey, message): repeated entries
+    # skip both the challenge hash and the square root
+    cache: Dict[Tuple[int, Tuple[int, int], bytes], Tuple[int, int]] = dict()
     for i in range(batch_size):
         r, s = _to_sig(ec, sig[i])
-        _ensure_msg_size(hf, ms[i])
-        ec.require_on_curve(P[i])
-        e = _e(ec, hf, r, P[i], ms[i])
-        # raises an error if y does not exist
-        # no need to check for quadratic residue
-        y = ec.y(r)
+        _ensure_msg_size(hf, ms[i], hsize)
+        Q = P[i][0], P[i][1]
+        j = pubkeys.get(Q)
+        if j is None:
+            ec.require_on_curve(Q)
+            if Q[1] == 0:
+                raise ValueError("public key is infinite")
+        key = r, Q, bytes(ms[i])
+        ey = cache.get(key)
+        if ey is None:
+            e = _e(ec, hf, r, Q, ms[i])
+            # raises an error if y does not exist
+            # no need to check for quadratic residue
+            y = ec.y(r)
+            cache[key] = e, y
+        else:
+            e, y = ey
 
         # a in [1, n-1]
         # deterministically generated using a CSPRNG seeded by a
         # cryptographic hash (e.g., SHA256) of all inputs of the
         # algorithm, or randomly generated independently for each
         # run of the batch verification algorithm
-        a = (1 if i == 0 else (1+random.getrandbits(ec.nlen)) % ec.n)
+        a = (1 if i == 0 else (1+getrandbits(nlen)) % n)
         scalars.append(a)
         points.append(_jac_from_aff((r, y)))
-        scalars.append(a * e % ec.n)
-        points.append(_jac_from_aff(P[i]))
-        t += a * s
-
-    TJ = _mult_jac(ec, t, ec.GJ)
+        if j is None:
+            pubkeys[Q] = len(points)
+            scalars.append(a * e % n)
+            points.append(_jac_from_aff(Q))
+        else:
+            scalars[j] = (scalars[j] + a * e) % n
+        t = (t + a * s) % n
+
+    TJ = _mult_jac_G(ec, t)
     RHSJ = _multi_mult(ec, scalars, points)
 
     # return T == RHS, checked in Jacobian coordinates
-    RHSZ2 = RHSJ[2] * RHSJ[2]
-    TZ2 = TJ[2] * TJ[2]
-    if (TJ[0] * RHSZ2)  % ec._p != (RHSJ[0] * TZ2) % ec._p:
-        return False
-
-    return (TJ[1] * RHSZ2 * RHSJ[2]) % ec._p == (RHSJ[1] * TZ2 * TJ[2]) % ec._p
+    return ec._jac_equality(TJ, RHSJ)
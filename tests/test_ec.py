@@ -14,7 +14,7 @@ from typing import List
 
 from btclib.numbertheory import mod_sqrt
 from btclib.curve import Curve, Point, mult, double_mult, \
-    _jac_from_aff, _mult_jac, _mult_aff, multi_mult
+    _jac_from_aff, _mult_jac, _mult_jac_G, _mult_aff, multi_mult
 from btclib.curves import secp256k1, secp256r1, secp384r1, secp160r1, \
     secp112r1, all_curves, low_card_curves, ec23_31
 from btclib.utils import octets_from_point, point_from_octets
@@ -309,6 +309,29 @@ class TestEllipticCurve(unittest.TestCase):
         checkInf = ec._aff_from_jac(_jac_from_aff(Inf))
         self.assertEqual(Inf, checkInf)
 
+        # batch conversion, including infinity points
+        ec = secp256k1
+        QJs = [_mult_jac(ec, q, ec.GJ) for q in (1, 2, 0, 3, ec.n, 5)]
+        Qs = [ec._aff_from_jac(QJ) for QJ in QJs]
+        self.assertEqual(Qs, ec._aff_from_jac_batch(QJs))
+        self.assertEqual([], ec._aff_from_jac_batch([]))
+
+    def test_jac_equality(self):
+        ec = secp256k1
+        QJ = _mult_jac(ec, 3, ec.GJ)
+        # same point, different Jacobian representation
+        Z = 0x1234567890ABCDEF
+        Z2 = Z*Z
+        RJ = QJ[0]*Z2 % ec._p, QJ[1]*Z2*Z % ec._p, QJ[2]*Z % ec._p
+        self.assertTrue(ec._jac_equality(QJ, RJ))
+        self.assertFalse(ec._jac_equality(QJ, ec.GJ))
+        # opposite points: same x, different y
+        self.assertFalse(ec._jac_equality(QJ, (QJ[0], ec._p - QJ[1], QJ[2])))
+        # infinity points
+        self.assertTrue(ec._jac_equality(InfJ, (5, 7, 0)))
+        self.assertFalse(ec._jac_equality(InfJ, QJ))
+        self.assertFalse(ec._jac_equality(QJ, InfJ))
+
     def test_add(self):
         for ec in all_curves:
             Q1 = mult(ec, ec._p)  # just a random point, not Inf
@@ -345,7 +368,16 @@ class TestEllipticCurve(unittest.TestCase):
                 Qjac = _mult_jac(ec, q, ec.GJ)
                 Q2 = ec._aff_from_jac(Qjac)
                 self.assertEqual(Q, Q2)
-        # with last curve
+                Qjac = _mult_jac_G(ec, q)
+                Q2 = ec._aff_from_jac(Qjac)
+                self.assertEqual(Q, Q2)
+        # fixed-base multiplication with a large curve
+        ec = secp256k1
+        for _ in range(10):
+            q = random.getrandbits(ec.nlen)
+            Q = ec._aff_from_jac(_mult_jac(ec, q, ec.GJ))
+            self.assertEqual(Q, ec._aff_from_jac(_mult_jac_G(ec, q)))
+        self.assertEqual(0, _mult_jac_G(ec, ec.n)[2])
         self.assertEqual(Inf, _mult_aff(ec, 3, Inf))
         self.assertEqual(InfJ, _mult_jac(ec, 3, InfJ))
 
@@ -376,6 +408,15 @@ class TestEllipticCurve(unittest.TestCase):
         boscoster = multi_mult(ec, k, P)
         self.assertEqual(boscoster, mult(ec, ksum))
 
+        # zero scalars and infinity points do not contribute
+        k.append(0)
+        P.append(ec.G)
+        k.append(ksum)
+        P.append(Inf)
+        self.assertEqual(boscoster, multi_mult(ec, k, P))
+        self.assertEqual(Inf, multi_mult(ec, [0, ec.n], [ec.G, ec.G]))
+        k = k[:-2]
+
         # mismatch between scalar length and Points length
         P = [ec.G] * (len(k)-1)
         self.assertRaises(ValueError, multi_mult, ec, k, P)
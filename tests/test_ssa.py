@@ -15,7 +15,8 @@ from typing import List
 
 from btclib.numbertheory import mod_inv, legendre_symbol
 from btclib.curve import Point, mult, double_mult
-from btclib.curves import secp256k1, secp224k1, low_card_curves
+from btclib.curves import secp256k1, secp224k1, secp112r2, secp128r2, \
+    low_card_curves
 from btclib.utils import int_from_octets, point_from_octets, octets_from_point, int_from_bits
 from btclib.pedersen import second_generator
 from btclib.rfc6979 import rfc6979
@@ -56,7 +57,7 @@ class TestEcssa(unittest.TestCase):
         fq = 0x2
         fQ = mult(ec, fq)
         self.assertFalse(ssa.verify(ec, hf, msg, fQ, sig))
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, fQ, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, fQ, sig))
 
         fq = 0x4
         fQ = mult(ec, fq)
@@ -192,7 +193,7 @@ class TestEcssa(unittest.TestCase):
         msg = bytes.fromhex("243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89")
         sig = (0x2A298DACAE57395A15D0795DDBFD1DCB564DA82B0F269BC70A74F8220429BA1D,
                0xFA16AEE06609280A19B67A24E1977E4697712B5FD2943914ECD5F730901B4AB7)
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
 
         # test vector 9
         # Incorrect sig: negated message hash
@@ -200,7 +201,7 @@ class TestEcssa(unittest.TestCase):
         msg = bytes.fromhex("5E2D58D8B3BCDF1ABADEC7829054F90DDA9805AAB56C77333024B9D0A508B75C")
         sig = (0x00DA9B08172A9B6F0466A2DEFD817F2D7AB437E0D253CB5395A963866B3574BE,
                0xD092F9D860F1776A1F7412AD8A1EB50DACCC222BC8C0E26B2056DF2F273EFDEC)
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
 
         # test vector 10
         # Incorrect sig: negated s value
@@ -208,14 +209,14 @@ class TestEcssa(unittest.TestCase):
         msg = b'\x00' * 32
         sig = (0x787A848E71043D280C50470E8E1532B2DD5D20EE912A45DBDD2BD1DFBF187EF6,
                0x8FCE5677CE7A623CB20011225797CE7A8DE1DC6CCD4F754A47DA6C600E59543C)
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
 
         # test vector 11
         # Incorrect sig: negated public key
         pub = point_from_octets(ec, "03DFF1D77F2A671C5F36183726DB2341BE58FEAE1DA2DECED843240F7B502BA659")
         msg = bytes.fromhex("243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89")
         sig = (0x2A298DACAE57395A15D0795DDBFD1DCB564DA82B0F269BC70A74F8220429BA1D, 0x1E51A22CCEC35599B8F266912281F8365FFC2D035A230434A1A64DC59F7013FD)
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
 
         # test vector 12
         # sG - eP is infinite.
@@ -224,7 +225,7 @@ class TestEcssa(unittest.TestCase):
         msg = bytes.fromhex("243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89")
         sig = (0x0000000000000000000000000000000000000000000000000000000000000000,
                0x9E9D01AF988B5CEDCE47221BFA9B222721F3FA408915444A4B489021DB55775F)
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
 
         # test vector 13
         # sG - eP is infinite.
@@ -233,7 +234,7 @@ class TestEcssa(unittest.TestCase):
         msg = bytes.fromhex("243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89")
         sig = (0x0000000000000000000000000000000000000000000000000000000000000001,
                0xD37DDF0254351836D84B1BD6A795FD5D523048F298C4214D187FE4892947F728)
-        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
 
         # test vector 14
         # sig[0:32] is not an X coordinate on the curve
@@ -249,8 +250,8 @@ class TestEcssa(unittest.TestCase):
         msg = bytes.fromhex("243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89")
         sig = (0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFC2F,
                0x1E51A22CCEC35599B8F266912281F8365FFC2D035A230434A1A64DC59F7013FD)
-        #self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
-        self.assertFalse(ssa._verify(ec, hf, msg, pub, sig))
+        self.assertRaises(ValueError, ssa._verify, ec, hf, msg, pub, sig)
+        self.assertFalse(ssa.verify(ec, hf, msg, pub, sig))
 
         # test vector 16
         # sig[32:64] is equal to curve order
@@ -299,6 +300,46 @@ class TestEcssa(unittest.TestCase):
                         # valid signature must validate
                         self.assertTrue(ssa._verify(ec, hf, h, Q, sig))
 
+    def test_cofactor_curves(self):
+        """verification on curves with cofactor h > 1"""
+        for ec in (secp112r2, secp128r2):
+            hsize = hf().digest_size
+            msg = random.getrandbits(hsize*8).to_bytes(hsize, 'big')
+            q = 1 + random.getrandbits(ec.nlen) % (ec.n - 1)
+            Q = mult(ec, q)
+
+            # valid signature
+            sig = ssa.sign(ec, hf, msg, q)
+            self.assertTrue(ssa._verify(ec, hf, msg, Q, sig))
+
+            # invalid s
+            fsig = sig[0], (sig[1] + 1) % ec.n
+            self.assertFalse(ssa._verify(ec, hf, msg, Q, fsig))
+
+            # sG - eP is infinite
+            r = ec.G[0]
+            e = ssa._e(ec, hf, r, Q, msg)
+            self.assertFalse(ssa._verify(ec, hf, msg, Q, (r, e*q % ec.n)))
+
+            # sG - eP = K with K.y not a quadratic residue
+            k = 1
+            K = mult(ec, k)
+            while legendre_symbol(K[1], ec._p) == 1:
+                k += 1
+                K = mult(ec, k)
+            e = ssa._e(ec, hf, K[0], Q, msg)
+            fsig = K[0], (k + e*q) % ec.n
+            self.assertFalse(ssa._verify(ec, hf, msg, Q, fsig))
+
+    def test_split_challenge(self):
+        for ec in (secp256k1, secp224k1):
+            for e in (0, 1, ec.n - 1, random.getrandbits(ec.nlen) % ec.n):
+                u, v = ssa._split_challenge(e, ec.n)
+                self.assertEqual(u % ec.n, e * v % ec.n)
+                self.assertNotEqual(v, 0)
+                self.assertLess(u*u, ec.n)
+                self.assertLessEqual(v*v, ec.n)
+
     def test_batch_validation(self):
         ec = secp256k1
         m = []
@@ -327,6 +368,12 @@ class TestEcssa(unittest.TestCase):
         self.assertFalse(ssa.batch_verify(ec, hf, m, Q, sig))
         #ssa._batch_verify(ec, hf, m, Q, sig)
         sig[-1] = sig[0]  # valid again
+        # repeated pubkey, message, and signature
+        self.assertTrue(ssa.batch_verify(ec, hf, m, Q, sig))
+        # repeated (r, pubkey, message) with a different s
+        sig[-1] = sig[0][0], (sig[0][1] + 1) % ec.n
+        self.assertFalse(ssa.batch_verify(ec, hf, m, Q, sig))
+        sig[-1] = sig[0]  # valid again
 
         # invalid 31 bytes message
         m[-1] = m[0][:-1]
@@ -334,6 +381,12 @@ class TestEcssa(unittest.TestCase):
         #ssa._batch_verify(ec, hf, m, Q, sig)
         m[-1] = m[0] # valid again
 
+        # infinite pubkey
+        Q[-1] = 1, 0
+        self.assertRaises(ValueError, ssa._batch_verify, ec, hf, m, Q, sig)
+        #ssa._batch_verify(ec, hf, m, Q, sig)
+        Q[-1] = Q[0] # valid again
+
         # mismatch between number of pubkeys and number of messages
         m.append(m[0])  # add extra message
         self.assertRaises(ValueError, ssa._batch_verify, ec, hf, m, Q, sig)